@@ -9,7 +9,6 @@ import numpy as np
 import random
 import json
 import csv
-import re
 from multiprocessing import Process
 from MetaScripts import meta
 from Evaluation import GraphDataOrganizer as gdo
@@ -180,7 +179,7 @@ def run_set_of_experiments(algo, datadir, randomized, repetitions, threaded=Fals
 	i = 0
 	for file in all_datafiles:
 		# construct output filename:
-		filename = re.split(r'\.json', file)[0]
+		filename = file.split('.json')[0]
 		result_filename = "results_"+algo.__name__
 		if randomized:
 			result_filename += "_R"+str(repetitions)
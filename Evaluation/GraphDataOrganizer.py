@@ -3,7 +3,6 @@
 
 import logging
 import networkx as nx
-import re
 import os
 import json
 import time
@@ -51,7 +50,7 @@ def check_filepath(filepath):
 	Return:
 		[dir, filename] : directory and filename as constructed from path
 	'''
-	path_components = re.split(r'/', filepath)
+	path_components = filepath.split('/')
 	path = ""
 	for directory in path_components[:-1]:
 		path += directory+"/"
@@ -70,8 +69,8 @@ def parse_graph_filename(filename):
 	'''
 	Parses a filename of a graphset-json and returns the parameters of the contained set
 	'''
-	basic_filename = re.split('\/', re.plit('\.', filename)[0])[-1]
-	parts = re.split('_', basic_filename)
+	basic_filename = filename.split('.')[0].split('/')[-1]
+	parts = basic_filename.split('_')
 	
 	parameters = {}
 	parameters["subclass"] = parts[0]
@@ -128,7 +127,7 @@ def write_graphs_to_json(list_of_graphs, filename, parameters={}):
 	data = []
 	id_nr = 0
 	for g in list_of_graphs:
-		filenameparts = re.split(r'\.', filename)
+		filenameparts = filename.split('.')
 		data.append(GraphData(g.nodes(), g.edges(), filenameparts[0]+"_"+str(id_nr), parameters))
 		id_nr += 1
 
@@ -205,7 +204,7 @@ def construct_set_random_graph(parameters, force_new_data=False):
 		filename_init += "_d"+str(parameters["deg_bound"])
 	if graphclass == "maxclique":
 		filename_init += "_c"+str(parameters["clique_bound"])
-	filename = re.sub('\.','', filename_init)
+	filename = filename_init.replace('.', '')
 	filepath = graphdir+filename+".json"
 	
 	if (not os.path.isfile(filepath)) or force_new_data:
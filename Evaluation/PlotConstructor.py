@@ -4,19 +4,8 @@
 import numpy as np
 import json
 import csv
-import re
 import os
 
-try:
-	import tkinter
-except ImportError:
-	import matplotlib
-	matplotlib.use('agg')
-	import matplotlib.pyplot as plt
-else:
-	import matplotlib.pyplot as plt
-	import matplotlib.lines as mlines
-
 from Evaluation import GraphDataOrganizer as gdo
 from Evaluation import ExperimentManager as em
 from Evaluation import StatisticsManager as sm
@@ -31,8 +20,7 @@ def get_resultfiles_filenames(directory, algos=None):
 		directory: the directory where the files are
 		algos : a list of algorithm-codes. If not None, only the specified algorithms will be considered.
 	'''
-	all_files_in_dir = os.listdir(directory)
-	allfiles = [file for file in all_files_in_dir if ".json" in file]
+	allfiles = sm.get_result_filenames(directory)
 	if not algos == None:
 		files = []
 		for algocode in algos:
@@ -42,7 +30,91 @@ def get_resultfiles_filenames(directory, algos=None):
 	files.sort()
 	return files
 
-def make_boxplot(data, setname, graph_set_id, ylabel, savedir=None, filename_suffix=None):
+def compute_boxplot_stats(data, whis=[5, 95]):
+	'''
+	computes the statistics that define a boxplot (median, quartiles, whiskers and fliers) for each of a set of samples,
+	as expected by matplotlib's Axes.bxp. This gives the same boxes as Axes.boxplot, but the percentiles of samples
+	of equal size are computed by a single numpy call instead of sorting each sample individually.
+
+	args:
+		data : a list of samples, each sample is a list of numbers
+		whis : the percentiles that define the range of the whiskers
+
+	return:
+		a list that contains a dict of statistics for each sample
+	'''
+	samples = [np.asarray(sample, dtype=np.float64) for sample in data]
+	percentiles = [whis[0], 25, 50, 75, whis[1]]
+	if len(samples) > 0 and len(samples[0]) > 0 and all(len(sample) == len(samples[0]) for sample in samples):
+		all_percentiles = np.percentile(np.array(samples), percentiles, axis=1).T
+	else:
+		all_percentiles = [np.percentile(sample, percentiles) if len(sample) > 0 else [np.nan]*5 for sample in samples]
+	
+	stats = []
+	for sample, [loval, q1, med, q3, hival] in zip(samples, all_percentiles):
+		# whiskers end at the most extreme data points within the whisker percentiles:
+		whishi = q3
+		whislo = q1
+		if len(sample) > 0:
+			wiskhi = sample[sample <= hival]
+			if len(wiskhi) > 0 and np.max(wiskhi) >= q3:
+				whishi = np.max(wiskhi)
+			wisklo = sample[sample >= loval]
+			if len(wisklo) > 0 and np.min(wisklo) <= q1:
+				whislo = np.min(wisklo)
+		stats.append({
+			"med" : med,
+			"q1" : q1,
+			"q3" : q3,
+			"whislo" : whislo,
+			"whishi" : whishi,
+			"fliers" : np.concatenate([sample[sample < whislo], sample[sample > whishi]])
+		})
+	return stats
+
+class BoxplotRenderer:
+	'''
+	Draws boxplots onto a single figure that is reused for all plots,
+	such that a series of boxplots does not construct a new figure for each plot.
+	'''
+	def __init__(self):
+		plt = meta.get_pyplot()
+		self.fig, self.ax = plt.subplots()
+	
+	def render(self, data, labels, ylabel, out_path=None):
+		'''
+		draws the boxplots of a dataset
+
+		args:
+			data : a list of lists, each sublist will induce a single boxplot
+			labels : the labels of the boxplots
+			ylabel : the label for the y-axis
+			out_path : if specified, the plot gets saved to this file.
+				if None, the plot gets shown directly
+		'''
+		plt = meta.get_pyplot()
+		self.ax.cla()
+		self.fig.set_size_inches(len(data), 6)
+		self.fig.subplots_adjust(bottom=0.3)
+
+		self.ax.set_xlabel('Algorithm')
+		self.ax.set_ylabel(ylabel)
+		
+		bp = self.ax.bxp(compute_boxplot_stats(data, whis=[5, 95]), flierprops={'marker': '+'})
+		plt.setp(bp['boxes'], color='black')
+		self.ax.set_xticklabels(labels)
+		for tick in self.ax.get_xticklabels():
+			tick.set_rotation(90)
+		
+		if out_path == None:
+			plt.show()
+		else:
+			self.fig.savefig(out_path, dpi=gs.PLT_DPI)
+	
+	def close(self):
+		meta.get_pyplot().close(self.fig)
+
+def make_boxplot(data, setname, graph_set_id, ylabel, savedir=None, filename_suffix=None, renderer=None):
 	'''
 	create a figure containing the boxplots of a specific dataset.
 	This method assumes that the data contains a list of lists, where each sublist corresponds to an algorithm
@@ -57,47 +129,42 @@ def make_boxplot(data, setname, graph_set_id, ylabel, savedir=None, filename_suf
 		savedir : if specified, the graph gets saved to this directory.
 			if None, the graph gets plotted directly
 		filename_suffix : an optional suffix to the autogenerated filename. gets only used if savedir != None.
+		renderer : an optional BoxplotRenderer to draw the plot with.
+			if None, a renderer is constructed for this plot only
 	'''
 
 	# initialize:
 	datadir = "data/eval/random_"+setname+"/results"
 	labels = [key for key in data]
 	for i in range(len(labels)):
-		labelparts = re.split('_', labels[i])
+		labelparts = labels[i].split('_')
 		labels[i] = labelparts[0]
 		if not labelparts[1] == "X":
 			labels[i] += "_"+labelparts[1]
 		if not labelparts[2] == "X":
 			labels[i] += "_"+labelparts[2]
 	
-	#print (labels)
-	# create plot:
-	fig, ax1 = plt.subplots(figsize=(len(data), 6))
-	#fig.canvas.set_window_title('A Boxplot Example')
-	fig.subplots_adjust(bottom=0.3)
-
-	ax1.set_xlabel('Algorithm')
-	ax1.set_ylabel(ylabel)
-	
 	if len(data.keys()) == 0:
 		print ("Error! No data!")
 		return
-		
-	bp = ax1.boxplot([data[key] for key in data], notch=0, sym='+', vert=1, whis=[5, 95])
-	plt.setp(bp['boxes'], color='black')
-	ax1.set_xticklabels(labels)
-	for tick in ax1.get_xticklabels():
-		tick.set_rotation(90)
-		
+	
 	if savedir == None:
-		plt.show()
+		out_path = None
 	elif filename_suffix == None:
-		plt.savefig(savedir+"/performance_"+setname+"_"+graph_set_id+"_algo_boxplots.png", dpi=gs.PLT_DPI)
+		out_path = savedir+"/performance_"+setname+"_"+graph_set_id+"_algo_boxplots.png"
 	else:
-		plt.savefig(savedir+"/performance_"+setname+"_"+graph_set_id+"_"+filename_suffix+"_algo_boxplots.png", dpi=gs.PLT_DPI)
-	plt.close()
+		out_path = savedir+"/performance_"+setname+"_"+graph_set_id+"_"+filename_suffix+"_algo_boxplots.png"
+	
+	# create plot:
+	if renderer == None:
+		boxplot_renderer = BoxplotRenderer()
+	else:
+		boxplot_renderer = renderer
+	boxplot_renderer.render([data[key] for key in data], labels, ylabel, out_path)
+	if renderer == None:
+		boxplot_renderer.close()
 
-def make_boxplot_set(setname, density_class, graph_set_id, axis="OUTPUT", type="ABSOLUTE", savedir=None):
+def make_boxplot_set(setname, density_class, graph_set_id, axis="OUTPUT", type="ABSOLUTE", savedir=None, renderer=None):
 	'''
 	Wrapper method for the function above ("make_boxplot"). This method loads data and calls make_boxplots.
 
@@ -109,13 +176,13 @@ def make_boxplot_set(setname, density_class, graph_set_id, axis="OUTPUT", type="
 		type : defines whether the absolute values or the relative performance should be used for plotting
 				("ABSOLUTE" or "RP")
 		savedir : specifies a directory where the produced plots are saved.
+		renderer : an optional BoxplotRenderer to draw the plot with
 	'''
 	
 	if type == "ABSOLUTE":
 		# initialize:
 		datadir = "data/eval/random_"+setname+"/results"
-		all_files_in_dir = os.listdir(datadir)
-		files = [file for file in all_files_in_dir if ".json" in file and graph_set_id in file and density_class in file]
+		files = [file for file in sm.get_result_filenames(datadir, graph_set_id) if density_class in file]
 		data = {}
 		files.sort()
 	
@@ -130,7 +197,7 @@ def make_boxplot_set(setname, density_class, graph_set_id, axis="OUTPUT", type="
 		
 	filename_suffix = axis+"_"+type+"_"+density_class
 			
-	make_boxplot(data, setname, graph_set_id, axis+" ("+type+")", savedir, filename_suffix)
+	make_boxplot(data, setname, graph_set_id, axis+" ("+type+")", savedir, filename_suffix, renderer)
 
 def make_boxplots_allsets(setname, axis="OUTPUT", type="ABSOLUTE"):
 	'''
@@ -145,10 +212,13 @@ def make_boxplots_allsets(setname, axis="OUTPUT", type="ABSOLUTE"):
 
 	all_graph_set_ids = []
 	for filename in os.listdir(graphdir):
-		all_graph_set_ids.append(re.split(r'\.',filename)[0])
+		all_graph_set_ids.append(filename.split('.')[0])
 
+	renderer = BoxplotRenderer()
 	for graph_set_id in all_graph_set_ids:
-		make_boxplot_set(setname, graph_set_id, axis, type, outputdir)
+		density_class = graph_set_id.split('_')[0]
+		make_boxplot_set(setname, density_class, graph_set_id, axis, type, outputdir, renderer)
+	renderer.close()
 
 def make_boxplots_total(setname, density_class=None, algos=None, axis="OUTPUT", type="ABSOLUTE"):
 	'''
@@ -183,7 +253,7 @@ def make_boxplots_total(setname, density_class=None, algos=None, axis="OUTPUT",
 
 	elif type == "RP":
 		for filename in os.listdir(graphdir):
-			graph_set_id = re.split(r'\.',filename)[0]
+			graph_set_id = filename.split('.')[0]
 			database = sm.compute_relative_performance_distribution_for_subclass(setname, density_class, graph_set_id, axis, algo_subset=algos)
 			for algo_key in database:
 				if algos == None or algo_key in algos:
@@ -217,6 +287,7 @@ def plot_performance_by_algorithm(setname, density_class, graph_set_id="ALL", al
 				("ABSOLUTE" or "RP")
 		savedir : specifies a directory where the produced plots are saved.
 	'''
+	plt = meta.get_pyplot()
 	basedir = "data/eval/random_"+setname
 	graphdir = basedir+"/input"
 	resultdir = basedir+"/results"
@@ -233,7 +304,7 @@ def plot_performance_by_algorithm(setname, density_class, graph_set_id="ALL", al
 		graph_set_filename_part = "total"
 		for filename in os.listdir(graphdir):
 			if density_class in filename:
-				all_graph_set_ids.append(re.split(r'\.',filename)[0])
+				all_graph_set_ids.append(filename.split('.')[0])
 	else:
 		graph_set_filename_part = graph_set_id
 		all_graph_set_ids.append(graph_set_id)
@@ -289,14 +360,14 @@ def plot_performance_by_algorithm(setname, density_class, graph_set_id="ALL", al
 	
 	for graph_set_id in all_graph_set_ids:
 		for i in range(len(linedata[graph_set_id][algo_ids[algo]])):
-			graph_size = re.split('_', graph_set_id)[1]
+			graph_size = graph_set_id.split('_')[1]
 			linecolor = gs.PLT_GRAPHSIZE_COLORS[graph_size]
 			this_linedata = [linedata[graph_set_id][algo_ids[algo]][i] for algo in algos]
 			line = ax1.plot(algo_numbers, this_linedata, label=graph_set_id, linewidth=0.2, color=linecolor)
 	
 	labels = []
 	for i in range(len(algos)):
-		labelparts = re.split('_', algos[i])
+		labelparts = algos[i].split('_')
 		labels.append(labelparts[0])
 		if not labelparts[1] == "X":
 			labels[i] += "_"+labelparts[1]
@@ -319,6 +390,8 @@ def plot_mean_performance_by_density(setname, n, axis="OUTPUT", type="ABSOLUTE",
 	'''
 	Constructs a 2D-line-plot of the mean performance of algorithms based on the density of graphs.
 	'''
+	plt = meta.get_pyplot()
+	import matplotlib.lines as mlines
 	basedir = "data/eval/random_"+setname
 	graphdir = basedir+"/input"
 	resultdir = basedir+"/results"
@@ -326,8 +399,8 @@ def plot_mean_performance_by_density(setname, n, axis="OUTPUT", type="ABSOLUTE",
 	all_graph_set_ids_master = {}
 	for filename in os.listdir(graphdir):
 		if "n"+str(n) in filename:
-			graph_set_id = re.split(r'\.',filename)[0]
-			graph_set_id_parts = re.split('_', graph_set_id)
+			graph_set_id = filename.split('.')[0]
+			graph_set_id_parts = graph_set_id.split('_')
 			if len(graph_set_id_parts) > 3:
 				if graph_set_id_parts[3] not in all_graph_set_ids_master:
 					all_graph_set_ids_master[graph_set_id_parts[3]] = []
@@ -337,6 +410,14 @@ def plot_mean_performance_by_density(setname, n, axis="OUTPUT", type="ABSOLUTE",
 					all_graph_set_ids_master[''] = []
 				all_graph_set_ids_master[''].append(graph_set_id)
 	
+	# index all result files by their graph set in a single pass over the result directory:
+	result_files_by_graph_set = {}
+	for filename in sm.get_result_filenames(resultdir):
+		graph_set_id = sm.get_graph_set_id_from_filename(filename)
+		if graph_set_id not in result_files_by_graph_set:
+			result_files_by_graph_set[graph_set_id] = []
+		result_files_by_graph_set[graph_set_id].append(filename)
+	
 	for graph_set_key in all_graph_set_ids_master:
 		files = []
 		
@@ -346,18 +427,18 @@ def plot_mean_performance_by_density(setname, n, axis="OUTPUT", type="ABSOLUTE",
 			filename_suffix += graph_set_key+"_"
 			
 		for graph_set_id in all_graph_set_ids:
-			files += [file for file in os.listdir(resultdir) if ".json" in file and graph_set_id in file]
+			files += result_files_by_graph_set.get(graph_set_id, [])
 	
 		database = {}
 		if type == "ABSOLUTE":
 			for file in files:
 				algo = sm.get_algo_name_from_filename(file)
-				evaldata = sm.load_evaldata_from_json(basedir, file)
-				avg_m = np.mean([data.m for data in evaldata])
+				m, output, running_time = sm.load_result_columns(resultdir+"/"+file)
+				avg_m = np.mean(m)
 				if axis == "OUTPUT":
-					data = [data.output for data in evaldata if data.output >= 0]
+					data = output[output >= 0]
 				elif axis == "TIME":
-					data = [data.running_time for data in evaldata if data.output >= 0]
+					data = running_time[output >= 0]
 				if algo not in database:
 					database[algo] = {}
 				database[algo][avg_m] = np.mean(data)
@@ -365,7 +446,7 @@ def plot_mean_performance_by_density(setname, n, axis="OUTPUT", type="ABSOLUTE",
 		elif type == "RP":
 			for graph_set_id in all_graph_set_ids:
 				mrt = sm.compute_mean_relative_performance(setname, graph_set_id, axis)
-				examplefile = [file for file in os.listdir(resultdir) if ".json" in file and graph_set_id in file][0]
+				examplefile = result_files_by_graph_set[graph_set_id][0]
 				evaldata = sm.load_evaldata_from_json(basedir, examplefile)
 				avg_m = np.mean([data.m for data in evaldata])
 				for algo in mrt:
@@ -376,7 +457,7 @@ def plot_mean_performance_by_density(setname, n, axis="OUTPUT", type="ABSOLUTE",
 		fig, ax = plt.subplots()
 		legenditems = {}
 		for algo in database:
-			basealgo = re.split('_', algo)[0]
+			basealgo = algo.split('_')[0]
 			linestyle = '-'
 			if "_B" in algo:
 				if "_R" in algo:
@@ -421,6 +502,8 @@ def performance_plot_analyze_reduction(setname, density_class, algocodes=None, n
 	print (n)
 	print (axis)
 	'''
+	plt = meta.get_pyplot()
+	import matplotlib.lines as mlines
 	if algocodes == None:
 		algocodes = ["EG", "SMS", "CMT", "EGPLUS", "LexM", "MCSM"]
 		
@@ -433,9 +516,9 @@ def performance_plot_analyze_reduction(setname, density_class, algocodes=None, n
 		
 	filenames_reduced = {}
 	filenames_basic = {}
-	for filename in os.listdir(resultdir):
-		if density_class in filename and "n"+str(n) in filename and not "_R" in filename and ".json" in filename:
-			filenameparts = re.split('_', filename)
+	for filename in sm.get_result_filenames(resultdir, "n"+str(n)):
+		if density_class in filename and not "_R" in filename:
+			filenameparts = filename.split('_')
 			this_n = -1
 			this_p = -1
 			algo = filenameparts[2]
@@ -447,9 +530,9 @@ def performance_plot_analyze_reduction(setname, density_class, algocodes=None, n
 					if part[0] == "n":
 						this_n = int(part[1:])
 					elif part[0] == "p":
-						this_p = float(re.split('\.',part)[0][2:])/100
+						this_p = float(part.split('.')[0][2:])/100
 					elif part[:4] == "relm":
-						this_p = float(re.split('\.',part)[0][4:])/10
+						this_p = float(part.split('.')[0][4:])/10
 						if this_p > 10:
 							this_p /= 10
 							
@@ -0,0 +1,62 @@
+#!usr/bin/python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+try:
+	import numba
+except ImportError:
+	numba = None
+
+NUMBA_AVAILABLE = not numba == None
+
+if NUMBA_AVAILABLE:
+	@numba.njit(parallel=True, cache=True)
+	def compute_dense_ranks(results):
+		'''
+		jit-compiled version of StatisticsManager.compute_dense_ranks.
+		Each row is sorted by an insertion sort, since the number of algorithms (i.e. columns) is small,
+		and the rows are processed in parallel.
+
+		Args:
+			results : a 2D numpy array, with one row per experiment and one column per algorithm
+
+		Return:
+			ranks : a numpy array of integers of the same shape as results
+		'''
+		number_of_results, number_of_algos = results.shape
+		ranks = np.empty((number_of_results, number_of_algos), dtype=np.int64)
+		if number_of_algos == 0:
+			return ranks
+		for i in numba.prange(number_of_results):
+			# if all algorithms got the same result (e.g. all timed out), they all share rank 1:
+			all_equal = True
+			for a in range(1, number_of_algos):
+				if not results[i, a] == results[i, 0]:
+					all_equal = False
+					break
+			if all_equal:
+				ranks[i, :] = 1
+				continue
+			# insertion sort of the column indices by the results of this row:
+			order = np.arange(number_of_algos)
+			for a in range(1, number_of_algos):
+				current = order[a]
+				b = a-1
+				while b >= 0 and results[i, order[b]] > results[i, current]:
+					order[b+1] = order[b]
+					b -= 1
+				order[b+1] = current
+			# assign dense ranks:
+			rank = 1
+			ranks[i, order[0]] = rank
+			for a in range(1, number_of_algos):
+				if results[i, order[a]] > results[i, order[a-1]]:
+					rank += 1
+				ranks[i, order[a]] = rank
+		return ranks
+
+	# compile once on import, so that the first call is not slowed down by the jit compilation:
+	compute_dense_ranks(np.zeros((1, 2)))
+else:
+	compute_dense_ranks = None
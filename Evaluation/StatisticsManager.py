@@ -5,24 +5,134 @@ import logging
 import numpy as np
 import json
 import csv
-import re
 import os
+import collections
+import functools
+import itertools
+import typing
 
 try:
-	import tkinter
+	import orjson
 except ImportError:
-	import matplotlib
-	matplotlib.use('agg')
-	import matplotlib.pyplot as plt
-else:
-	import matplotlib.pyplot as plt
-	import matplotlib.lines as mlines
+	orjson = None
+
+try:
+	import msgspec
+except ImportError:
+	msgspec = None
 
 from Evaluation import GraphDataOrganizer as gdo
 from Evaluation import ExperimentManager as em
 from MetaScripts import meta
 from MetaScripts import global_settings as gs
 
+if not msgspec == None:
+	class EvalRecord(msgspec.Struct):
+		'''
+		A single record of a result file, as decoded by msgspec.
+		The numbers keep the types that are stored in the file (e.g. an integer time limit stays an integer),
+		such that the results are the same as without msgspec.
+		'''
+		input_id: str
+		output: int
+		running_time: typing.Union[int, float]
+		timelimit: typing.Union[int, float] = -1
+		algo: str = "generic"
+		randomized: bool = False
+		repetitions: int = 1
+		reduce_graph: bool = True
+		out_mean: typing.Union[int, float, None] = msgspec.field(default=None, name="output mean")
+		out_var: typing.Union[int, float, None] = msgspec.field(default=None, name="output variance")
+	
+	_evalrecord_decoder = msgspec.json.Decoder(typing.List[EvalRecord])
+else:
+	class EvalRecord:
+		'''
+		A single record of a result file
+		'''
+		def __init__(self, input_id, output, running_time, timelimit=-1, algo="generic", randomized=False, repetitions=1, reduce_graph=True, out_mean=None, out_var=None):
+			self.input_id = input_id
+			self.output = output
+			self.running_time = running_time
+			self.timelimit = timelimit
+			self.algo = algo
+			self.randomized = randomized
+			self.repetitions = repetitions
+			self.reduce_graph = reduce_graph
+			self.out_mean = out_mean
+			self.out_var = out_var
+	
+	_evalrecord_decoder = None
+
+# the maximum number of parsed json files that are kept in memory:
+JSON_CACHE_SIZE = 32
+# parsed json files, maps (filepath, decoder) to (modification time, payload).
+# ordered by the last access, such that the least recently used file gets evicted first.
+# not safe for concurrent access from several threads, so the files are loaded sequentially:
+_json_cache = collections.OrderedDict()
+
+def load_json_file(filepath, decoder=None):
+	'''
+	loads and parses a json file.
+	uses orjson if it is installed, otherwise the json module of the standard library.
+	The parsed payload is cached per filepath (invalidated by the modification time of the file),
+	so that a file that gets loaded by several statistics methods is parsed only once.
+	At most JSON_CACHE_SIZE files are cached.
+
+	args:
+		filepath: the path of the file
+		decoder: if not None, a msgspec decoder that is used to decode the file into typed objects
+
+	return:
+		the parsed content of the file
+	'''
+	key = (filepath, decoder)
+	mtime = os.path.getmtime(filepath)
+	if key in _json_cache and _json_cache[key][0] == mtime:
+		_json_cache.move_to_end(key)
+		return _json_cache[key][1]
+	with open(filepath, 'rb') as jsonfile:
+		if not decoder == None:
+			payload = decoder.decode(jsonfile.read())
+		elif orjson == None:
+			payload = json.load(jsonfile)
+		else:
+			payload = orjson.loads(jsonfile.read())
+	_json_cache[key] = (mtime, payload)
+	_json_cache.move_to_end(key)
+	while len(_json_cache) > JSON_CACHE_SIZE:
+		_json_cache.popitem(last=False)
+	return payload
+
+def load_evaldata_records(filepath):
+	'''
+	loads the records of a result file as a list of EvalRecord.
+	If msgspec is installed, the file gets decoded directly into EvalRecord structs without constructing intermediate dicts.
+
+	args:
+		filepath: the path of the file
+
+	return:
+		a list of EvalRecord
+	'''
+	if not _evalrecord_decoder == None:
+		return load_json_file(filepath, _evalrecord_decoder)
+	records = []
+	for data in load_json_file(filepath):
+		records.append(EvalRecord(
+			data["input_id"],
+			data["output"],
+			data["running_time"],
+			data.get("timelimit", -1),
+			data.get("algo", "generic"),
+			data.get("randomized", False),
+			data.get("repetitions", 1),
+			data.get("reduce_graph", True),
+			data.get("output mean"),
+			data.get("output variance")
+		))
+	return records
+
 def load_axis_data_from_file(filename, axis, keep_nulls=False, cutoff_at_timelimit=True):
 	'''
 	loads evaluation data from a file
@@ -38,8 +148,7 @@ def load_axis_data_from_file(filename, axis, keep_nulls=False, cutoff_at_timelim
 	'''
 	if not os.path.isfile(filename):
 		return [-1 for i in range(100)]
-	with open(filename) as jsonfile:
-		this_file_data = json.load(jsonfile)
+	this_file_data = load_json_file(filename)
 	
 	if not cutoff_at_timelimit:
 		if axis=="OUTPUT":
@@ -57,55 +166,140 @@ def load_axis_data_from_file(filename, axis, keep_nulls=False, cutoff_at_timelim
 	else:
 		return data
 
+def load_axis_ndarray(filename, axis, keep_nulls=False, cutoff_at_timelimit=True):
+	'''
+	loads evaluation data from a file, like load_axis_data_from_file,
+	but streams the values directly into a numpy array instead of building a list first
+
+	args:
+		filename: the filename
+		axis: "OUTPUT" or "TIME", defines which data to load
+		keep_nulls: if False, null-entries are removed from the data before returning
+		cutoff_at_timelimit : if True, evaldata that terminated with exceeded timelimit is considered as not terminated
+
+	return:
+		a 1D numpy array of floats
+	'''
+	if not os.path.isfile(filename):
+		return np.full(100, -1, dtype=np.float64)
+	this_file_data = load_json_file(filename)
+	
+	count = len(this_file_data)
+	if not cutoff_at_timelimit:
+		if axis=="OUTPUT":
+			values = (d["output"] for d in this_file_data)
+		elif axis=="TIME":
+			values = (d["running_time"] for d in this_file_data if d["running_time"]>0)
+			count = -1
+	else:
+		if axis=="OUTPUT":
+			values = (d["output"] if d["running_time"] < d["timelimit"] else -1 for d in this_file_data)
+		elif axis=="TIME":
+			values = (d["running_time"] if d["running_time"] > 0 and d["running_time"] < d["timelimit"] else d["timelimit"] for d in this_file_data)
+	data = np.fromiter(values, dtype=np.float64, count=count)
+
+	if not keep_nulls:
+		return data[data>=0]
+	else:
+		return data
+
+def load_result_columns(filename):
+	'''
+	loads the number of edges, the output and the running time of all experiments in a result file,
+	without constructing EvalData objects or loading the input graphs
+
+	args:
+		filename: the filename
+
+	return:
+		(m, output, running_time) : three numpy arrays with one entry per experiment
+	'''
+	this_file_data = load_json_file(filename)
+	count = len(this_file_data)
+	m = np.fromiter((d["m"] for d in this_file_data), dtype=np.float64, count=count)
+	output = np.fromiter((d["output"] for d in this_file_data), dtype=np.int64, count=count)
+	running_time = np.fromiter((d["running_time"] for d in this_file_data), dtype=np.float64, count=count)
+	return (m, output, running_time)
+
+def get_result_filenames(datadir, graph_set_id=None):
+	'''
+	lists the names of all result files (i.e. json files) in a directory
+
+	args:
+		datadir: the directory
+		graph_set_id: if not None, only files whose name contains this id are listed
+
+	return:
+		a list of filenames
+	'''
+	with os.scandir(datadir) as entries:
+		if graph_set_id == None:
+			return [entry.name for entry in entries if entry.name.endswith(".json")]
+		return [entry.name for entry in entries if entry.name.endswith(".json") and graph_set_id in entry.name]
+
 def get_algo_name_from_filename(filename):
 	'''
 	parses a filename of a EvalData file to get the name of the algorithm
 	'''
-	algo_parts = re.split('_',filename)
+	algo_parts = filename.split('_')
 	algo_name = algo_parts[2]+"_"+algo_parts[3]+"_"+algo_parts[4]
 	
 	return algo_name
 
+def get_graph_set_id_from_filename(filename):
+	'''
+	parses a filename of a EvalData file to get the id of the graph set it was computed on
+	'''
+	graph_set_parts = filename.split('.')[0].split('_')
+	
+	return "_".join(graph_set_parts[5:])
+
+# the maximum number of sets of input graphs that are kept in memory:
+INPUT_GRAPHS_CACHE_SIZE = 4
+
+def load_input_graphs(basedir, graphdatafile):
+	'''
+	Loads the input graphs of a set of experiments and indexes them by their id.
+	The result is cached (invalidated by the modification time of the file), such that the input file is loaded
+	only once for all result files that are based on it. At most INPUT_GRAPHS_CACHE_SIZE files are cached.
+	The returned GraphData objects are shared between all callers, so they must not be modified.
+	'''
+	filepath = basedir+"/input/"+graphdatafile
+	return load_input_graphs_file(filepath, os.path.getmtime(filepath))
+
+@functools.lru_cache(maxsize=INPUT_GRAPHS_CACHE_SIZE)
+def load_input_graphs_file(filepath, mtime):
+	'''
+	Loads and indexes the input graphs of a file, see load_input_graphs.
+	The modification time is only part of the arguments such that a rewritten file gets loaded again.
+	'''
+	graphdataset = gdo.load_graphs_from_json(filepath)
+	for gd in graphdataset:
+		gd.id = gd.id.split('.')[0]
+	return {gd.id : gd for gd in graphdataset}
+
 def load_evaldata_from_json(basedir, filename):
 	'''
 	Loads the Evaldata from a specific file
 	'''
-	graphdataset = []
 	evaldataset = []
 	filepath = basedir+"/results/"+filename
 	if not "json" in filepath:
 		filepath+=".json"
-	with open(filepath,"r") as jsonfile:
-		dataset = json.load(jsonfile)
-		for data in dataset:
-			graph_id = re.split(r'\.',data["input_id"])[0]
-			if graphdataset == []:
-				graphdatafile = "_".join(re.split(r'_',data["input_id"])[:-1])+".json"
-				graphdataset = gdo.load_graphs_from_json(basedir+"/input/"+graphdatafile)
-			graphdata = None
-			for gd in graphdataset:
-				gd.id = re.split(r'\.', gd.id)[0]
-				if gd.id == graph_id:
-					graphdata = gd
-					break
-			if "reduce_graph" not in data:
-				data["reduce_graph"] = True
-			if "timelimit" not in data:
-				data["timelimit"] = -1
-			if "randomized" not in data:
-				data["randomized"] = False
-			if "repetitions" not in data:
-				data["repetitions"] = 1
-			if "algo" in data:
-				evaldata = em.EvalData(data["algo"], graphdata, data["randomized"], data["repetitions"], data["reduce_graph"], data["timelimit"])
-			else:
-				evaldata = em.EvalData("generic", graphdata)
-			evaldata.set_results(data["output"], data["running_time"])
-			if "output mean" in data:
-				evaldata.out_mean = data["output mean"]
-			if "output variance" in data:
-				evaldata.out_var = data["output variance"]
-			evaldataset.append(evaldata)
+	dataset = load_evaldata_records(filepath)
+	if len(dataset) > 0:
+		graphdatafile = "_".join(dataset[0].input_id.split('_')[:-1])+".json"
+		graph_index = load_input_graphs(basedir, graphdatafile)
+	for data in dataset:
+		graph_id = data.input_id.split('.')[0]
+		graphdata = graph_index.get(graph_id)
+		evaldata = em.EvalData(data.algo, graphdata, data.randomized, data.repetitions, data.reduce_graph, data.timelimit)
+		evaldata.set_results(data.output, data.running_time)
+		if not data.out_mean == None:
+			evaldata.out_mean = data.out_mean
+		if not data.out_var == None:
+			evaldata.out_var = data.out_var
+		evaldataset.append(evaldata)
 	return evaldataset
 	
 def load_data(graphclass="general", density_class="dense", n=None, p=None, rel_m=None, d=None, c=None, algocode=None, randomized=False, rand_repetitions=None, reduced=False, axis="OUTPUT", keep_nulls=False, cutoff_at_timelimit=False):
@@ -184,49 +378,97 @@ def load_data(graphclass="general", density_class="dense", n=None, p=None, rel_m
 	else:
 		options_for_c = [-1]
 			
+	extended_algo_code = algocode
+	if randomized:
+		extended_algo_code += "_R"+str(rand_repetitions)
+	else:
+		extended_algo_code += "_X"
+	if not reduced:
+		extended_algo_code += "_B"
+	else:
+		extended_algo_code += "_X"
+	
+	# list the result directory once, instead of checking each file of the parameter grid on disk:
+	if os.path.isdir(base_dir):
+		existing_files = set(get_result_filenames(base_dir))
+	else:
+		existing_files = set()
+	
 	data = {}
-	for n in options_for_n:
-		if n not in data:
-			data[n] = {}
-		for p in options_for_p:
-			if p not in data[n]:
-				data[n][p] = {}
-			for rel_m in options_for_relm:
-				if rel_m not in data[n][p]:
-					data[n][p][rel_m] = {}
-				for d in options_for_d:
-					if d not in data[n][p][rel_m]:
-						data[n][p][rel_m][d] = {}
-					for c in options_for_c:
-						if c not in data[n][p][rel_m][d]:
-							data[n][p][rel_m][d][c] = {}
-						if density_class == "dense":
-							p_as_string = p_as_string = "{0:.2f}".format(p)
-							graph_base_filename = "dense_n"+str(n)+"_p"+p_as_string
-						elif density_class == "sparse":
-							graph_base_filename = "sparse_n"+str(n)+"_relm"+str(rel_m)
-						if graphclass == "maxdeg":
-							graph_base_filename += "_d"+str(d)
-						if graphclass == "maxclique":
-							graph_base_filename += "_c"+str(c)
-						graph_filename = re.sub('\.','', graph_base_filename)
-						extended_algo_code = algocode
-						if randomized:
-							extended_algo_code += "_R"+str(rand_repetitions)
-						else:
-							extended_algo_code += "_X"
-						if not reduced:
-							extended_algo_code += "_B"
-						else:
-							extended_algo_code += "_X"
-							
-						evaldata_filename = "results_triangulate_"+extended_algo_code+"_"+graph_filename
-						#print (evaldata_filename)
-						
-						filepath = base_dir+"/"+evaldata_filename+".json"
-						data[n][p][rel_m][d][c][density_class] = load_axis_data_from_file(filepath, axis, keep_nulls, cutoff_at_timelimit)
+	for n, p, rel_m, d, c in itertools.product(options_for_n, options_for_p, options_for_relm, options_for_d, options_for_c):
+		if density_class == "dense":
+			p_as_string = "{0:.2f}".format(p)
+			graph_base_filename = "dense_n"+str(n)+"_p"+p_as_string
+		elif density_class == "sparse":
+			graph_base_filename = "sparse_n"+str(n)+"_relm"+str(rel_m)
+		if graphclass == "maxdeg":
+			graph_base_filename += "_d"+str(d)
+		if graphclass == "maxclique":
+			graph_base_filename += "_c"+str(c)
+		graph_filename = graph_base_filename.replace('.', '')
+		
+		evaldata_filename = "results_triangulate_"+extended_algo_code+"_"+graph_filename+".json"
+		#print (evaldata_filename)
+		
+		cell = data.setdefault(n, {}).setdefault(p, {}).setdefault(rel_m, {}).setdefault(d, {}).setdefault(c, {})
+		if evaldata_filename in existing_files:
+			cell[density_class] = load_axis_data_from_file(base_dir+"/"+evaldata_filename, axis, keep_nulls, cutoff_at_timelimit)
+		else:
+			cell[density_class] = [-1 for i in range(100)]
 	return data								
 				
+def compute_evaldata_statistics(evaldata):
+	'''
+	Computes the statistics of a list of EvalData in a single pass.
+	Mean and variance of running time and output are computed with Welford's algorithm,
+	considering only experiments that terminated (i.e. output >= 0).
+	
+	return:
+		a dict containing the values for the columns "avg n", "avg m", "mean time", "var time",
+		"moo", "voo", "mmo", "mvo" and "success (\%)". The mean or variance of an empty set is nan.
+	'''
+	sum_n = 0
+	sum_m = 0
+	count = 0
+	mean_time = 0.0
+	m2_time = 0.0
+	mean_output = 0.0
+	m2_output = 0.0
+	count_out_mean = 0
+	mean_out_mean = 0.0
+	count_out_var = 0
+	mean_out_var = 0.0
+	for data in evaldata:
+		sum_n += data.n
+		sum_m += data.m
+		if data.output >= 0:
+			count += 1
+			delta = data.running_time - mean_time
+			mean_time += delta/count
+			m2_time += delta*(data.running_time - mean_time)
+			delta = data.output - mean_output
+			mean_output += delta/count
+			m2_output += delta*(data.output - mean_output)
+		if not data.out_mean == None and data.out_mean >= 0:
+			count_out_mean += 1
+			mean_out_mean += (data.out_mean - mean_out_mean)/count_out_mean
+		if not data.out_var == None and data.out_var >= 0:
+			count_out_var += 1
+			mean_out_var += (data.out_var - mean_out_var)/count_out_var
+	
+	nan = float("nan")
+	return {
+		"avg n" : float(sum_n)/len(evaldata),
+		"avg m" : float(sum_m)/len(evaldata),
+		"mean time" : mean_time if count > 0 else nan,
+		"var time" : m2_time/count if count > 0 else nan,
+		"moo" : mean_output if count > 0 else nan,
+		"voo" : m2_output/count if count > 0 else nan,
+		"mmo" : mean_out_mean if count_out_mean > 0 else nan,
+		"mvo" : mean_out_var if count_out_var > 0 else nan,
+		"success (\%)" : 100*float(count)/float(len(evaldata))
+	}
+				
 def compute_statistics(graphclass, density_class=None, algo=None):
 	'''
 	Computes relevant statistic from all EvalData files in a specific directory.
@@ -244,64 +486,53 @@ def compute_statistics(graphclass, density_class=None, algo=None):
 
 	stats = []
 	columns = ["graph id", "avg n", "avg m", "algorithm", "reduced", "repeats", "time limit", "mean time", "var time", "moo", "voo", "mmo", "mvo", "success (\%)"]
-	progress = 0
-	allfiles = [file for file in os.listdir(datadir+"/results") if ".json" in file]
+	allfiles = get_result_filenames(datadir+"/results")
 	
 	if not density_class == None:
 		allfiles = [file for file in allfiles if density_class in file]
 	if not algo == None:
 		allfiles = [file for file in allfiles if algo in file]
-	for file in allfiles:
+	
+	for progress, file in enumerate(allfiles):
 		meta.print_progress(progress, len(allfiles))
-		progress += 1
-
-		filename = re.split(r'\.', file)[0]
-		evaldata = load_evaldata_from_json(datadir, filename)
-		graph_id = "_".join(re.split(r'_',evaldata[0].id)[:-1])
-		avg_n = np.mean([data.n for data in evaldata])# if data.output >= 0])
-		avg_m = np.mean([data.m for data in evaldata])# if data.output >= 0])
-		timelimit = evaldata[0].timelimit
-		mean_time = np.mean([data.running_time for data in evaldata if data.output >= 0])
-		var_time = np.var([data.running_time for data in evaldata if data.output >= 0])
-		mean_output = np.mean([data.output for data in evaldata if data.output >= 0])
-		var_output = np.var([data.output for data in evaldata if data.output >= 0])
-		repeats = evaldata[0].repetitions
-		mmo = np.mean([data.out_mean for data in evaldata if data.out_mean >= 0])
-		mvo = np.mean([data.out_var for data in evaldata if data.out_var >= 0])
-		algo_name = evaldata[0].algo
-		if evaldata[0].is_randomized:
-			algo_name += " (R)"
-
-		if mmo == mean_output:
-			mmo = "N/A"
-			mvo = "N/A"
-
-		success = 100*float(len([data.output for data in evaldata if data.output >= 0]))/float(len([data.output for data in evaldata]))
-
-		newstats = {
-			"algorithm" : algo_name,
-			"reduced" : str(evaldata[0].reduce_graph),
-			"graph id" : graph_id,
-			"avg n" : avg_n,
-			"avg m" : avg_m, 
-			"mean time" : mean_time,
-			"var time" : var_time,
-			"moo" : mean_output,
-			"voo" : var_output,
-			"repeats" : repeats,
-			"mmo" : mmo,
-			"mvo" : mvo,
-			"time limit" : timelimit,
-			"success (\%)": success
-		}
-		for key in newstats:
-			if not isinstance(newstats[key], str) and np.isnan(newstats[key]):
-				newstats[key] = "N/A"
-
-		stats.append(newstats)
+		evaldata = load_evaldata_from_json(datadir, file.split('.')[0])
+		stats.append(compute_file_statistics(evaldata))
 	write_stats_to_file(datadir, stats)
 
 	return (columns, stats)
+
+def compute_file_statistics(evaldata):
+	'''
+	Computes the statistics of the EvalData of a single file, as listed by compute_statistics
+
+	args:
+		evaldata : the list of EvalData loaded from the file
+
+	return:
+		a dict that maps the columns of compute_statistics to their values
+	'''
+	graph_id = "_".join(evaldata[0].id.split('_')[:-1])
+	timelimit = evaldata[0].timelimit
+	repeats = evaldata[0].repetitions
+	algo_name = evaldata[0].algo
+	if evaldata[0].is_randomized:
+		algo_name += " (R)"
+
+	newstats = compute_evaldata_statistics(evaldata)
+	if newstats["mmo"] == newstats["moo"]:
+		newstats["mmo"] = "N/A"
+		newstats["mvo"] = "N/A"
+
+	newstats["algorithm"] = algo_name
+	newstats["reduced"] = str(evaldata[0].reduce_graph)
+	newstats["graph id"] = graph_id
+	newstats["repeats"] = repeats
+	newstats["time limit"] = timelimit
+	for key in newstats:
+		if not isinstance(newstats[key], str) and np.isnan(newstats[key]):
+			newstats[key] = "N/A"
+
+	return newstats
 	
 def write_stats_to_file(datadir, stats):
 	with open(datadir+"/stats.json", 'w') as statsfile:
@@ -322,13 +553,32 @@ def load_stats_from_file(datadir):
 
 	return data
 	
+def compute_dense_ranks(results):
+	'''
+	ranks the entries of each row of a matrix, such that the smallest value of a row gets rank 1,
+	equal values get equal ranks and each larger distinct value gets the next rank.
+	
+	Args:
+		results : a 2D numpy array, with one row per experiment and one column per algorithm
+		
+	Return:
+		ranks : a numpy array of integers of the same shape as results
+	'''
+	order = np.argsort(results, axis=1, kind='stable')
+	sorted_results = np.take_along_axis(results, order, axis=1)
+	sorted_ranks = np.ones(results.shape, dtype=np.int64)
+	sorted_ranks[:,1:] += np.cumsum(sorted_results[:,1:] > sorted_results[:,:-1], axis=1)
+	ranks = np.empty_like(sorted_ranks)
+	np.put_along_axis(ranks, order, sorted_ranks, axis=1)
+	return ranks
+
 def compute_relative_performance_distribution(data, negative_is_invalid=True):
 	'''
 	computes relative performance distribution for a set of algorithms on a set of experiments
 	
 	Args:
 		data : a dict {algorithm : results}
-			where dict[algorithm] is a list of numeric values, and has the same length for all algorithms
+			where dict[algorithm] is a list (or 1D numpy array) of numeric values, and has the same length for all algorithms
 		negative_is_invales : if True, negative values in the result data are interpreted as invalid results
 			and get set to infinity when computing the relative performance.
 		
@@ -348,52 +598,48 @@ def compute_relative_performance_distribution(data, negative_is_invalid=True):
 			## TODO : raise exception
 			return rpd
 			
-	for i in range(number_of_results):
-		results = {}
-		# compute relative performance:
-		for algo in algos:
-			results[algo] = data[algo][i]
-			if negative_is_invalid and results[algo] < 0:
-				results[algo] = float("inf")
-		algoorder = sorted(algos, key=lambda a: results[a])
-		j = 1
-		for a_i in range(len(algos)):
-			rpd[algoorder[a_i]].append(j)
-			if a_i < len(algos)-1 and results[algoorder[a_i+1]] > results[algoorder[a_i]]:
-				j += 1
-		
-		# scale relative performance:
-		for algo in algos:
-			if not j == 1:
-				rpd[algo][i] = 1+((len(algos)-1)*float(rpd[algo][i]-1)/(j-1))
-			else:
-				rpd[algo][i] = len(algos)
+	# results as a matrix with one row per experiment and one column per algorithm:
+	results = np.empty((number_of_results, len(algos)), dtype=np.float64)
+	for a_i in range(len(algos)):
+		results[:,a_i] = data[algos[a_i]]
+	if negative_is_invalid:
+		results[results < 0] = np.inf
+	# use the jit-compiled ranking if numba is installed:
+	from Evaluation import RankingKernels as rk
+	if rk.NUMBA_AVAILABLE:
+		ranks = rk.compute_dense_ranks(results)
+	else:
+		ranks = compute_dense_ranks(results)
+	
+	# scale relative performance:
+	number_of_algos = len(algos)
+	max_ranks = ranks.max(axis=1, keepdims=True)
+	scaled = 1+(number_of_algos-1)*(ranks-1)/np.maximum(max_ranks-1, 1)
+	scaled = np.where(max_ranks == 1, number_of_algos, scaled)
+	for a_i in range(number_of_algos):
+		rpd[algos[a_i]] = scaled[:,a_i].tolist()
 				
 	return rpd	
 
-def compute_relative_performance_distribution_for_subclass(setname, density_class, graph_set_id, axis="OUTPUT", algo_subset=None):
+def load_relative_performance_data(setname, density_class, graph_set_id, axis="OUTPUT"):
 	'''
 	for a set of experiments defined by a setname and a graph_set_id,
-	this method computes the relative performance of all algorithms individually
-	for each graph of the dataset.
-	That is, for each graph of the dataset the algorithms get ordered by performance.
+	this method loads the results of all algorithms, as required to compute the relative performance.
+	The parsed result files are cached by load_json_file (which notices if a file has been rewritten),
+	so repeated calls only rebuild the arrays.
 
 	Args:
 		setname : the name of the major graph class (ie. "general", "planar", ...)
 		density_class : the density_class. If this is set to None, all density settings will be considered.
 		graph_set_id : the id of the subclass of graphs
-		axis : the axis of evaluation output that should be used for evaluation, ie "OUTPUT" or "TIME"
-		algo_subset : if not None, only algorithms contained in this subset will be considered
+		axis : the axis of evaluation output that should be loaded, ie "OUTPUT" or "TIME"
 
 	Return:
-		rpd : a dict that maps algorithms to lists. For each algorithm a list is constructed that contains the
-		relative performance on each input graph.
-		That is, if "ALGO_A" performed second best on the 15th test graph, then rp["ALGO_A"][14] = 2
+		data : a dict {algorithm : results}, where the results of each algorithm are a numpy array
 	'''
 	# initialize:
 	datadir = "data/eval/random_"+setname+"/results"
-	all_files_in_dir = os.listdir(datadir)
-	files_all = [file for file in all_files_in_dir if ".json" in file and graph_set_id in file]
+	files_all = get_result_filenames(datadir, graph_set_id)
 	if not density_class == None:
 		files = [file for file in files_all if density_class in file]
 	else:
@@ -405,28 +651,49 @@ def compute_relative_performance_distribution_for_subclass(setname, density_clas
 	for algofile in files:
 		filepath = datadir+"/"+algofile
 		algo = get_algo_name_from_filename(algofile)
-		if algo_subset == None or algo in algo_subset:
-			#algo_basecode = re.split('_', algo)[0]
-			data[algo] = load_axis_data_from_file(filepath, axis, True, True)
+		data[algo] = load_axis_ndarray(filepath, axis, True, True)
+	return data
+
+def compute_relative_performance_distribution_for_subclass(setname, density_class, graph_set_id, axis="OUTPUT", algo_subset=None):
+	'''
+	for a set of experiments defined by a setname and a graph_set_id,
+	this method computes the relative performance of all algorithms individually
+	for each graph of the dataset.
+	That is, for each graph of the dataset the algorithms get ordered by performance.
+
+	Args:
+		setname : the name of the major graph class (ie. "general", "planar", ...)
+		density_class : the density_class. If this is set to None, all density settings will be considered.
+		graph_set_id : the id of the subclass of graphs
+		axis : the axis of evaluation output that should be used for evaluation, ie "OUTPUT" or "TIME"
+		algo_subset : if not None, only algorithms contained in this subset will be considered
+
+	Return:
+		rpd : a dict that maps algorithms to lists. For each algorithm a list is constructed that contains the
+		relative performance on each input graph.
+		That is, if "ALGO_A" performed second best on the 15th test graph, then rp["ALGO_A"][14] = 2
+	'''
+	all_data = load_relative_performance_data(setname, density_class, graph_set_id, axis)
+	data = {algo : all_data[algo] for algo in all_data if algo_subset == None or algo in algo_subset}
 			
-	#print (setname+" - "+density_class+" - "+graph_set_id)
 	if len(data.keys()) > 0:
 		return compute_relative_performance_distribution(data)
 	else:
 		return {}
 
 def compute_mean_relative_performance(setname, graph_set_id, axis="OUTPUT"):
-	# initialize:
-	datadir = "data/eval/random_"+setname+"/results"
-	all_files_in_dir = os.listdir(datadir)
-	files = [file for file in all_files_in_dir if ".json" in file and graph_set_id in file]
-	algos = []
-	
-	# load data:
-	for algofile in files:
-		algos.append(get_algo_name_from_filename(algofile))
+	'''
+	computes the mean relative performance of all algorithms on a set of experiments
+	defined by a setname and a graph_set_id.
+
+	Return:
+		mrp : a dict {algorithm : mean relative performance}
+	'''
+	data = load_relative_performance_data(setname, None, graph_set_id, axis)
+	if len(data.keys()) == 0:
+		return {}
 
-	rp = compute_relative_performance_distribution(setname, graph_set_id, axis)
-	mrp = {algo : np.mean(rp[algo]) for algo in algos}
+	rp = compute_relative_performance_distribution(data)
+	mrp = {algo : np.mean(rp[algo]) for algo in rp}
 
 	return mrp
\ No newline at end of file
@@ -4,19 +4,8 @@
 import numpy as np
 import json
 import csv
-import re
 import os
 
-try:
-	import tkinter
-except ImportError:
-	import matplotlib
-	matplotlib.use('agg')
-	import matplotlib.pyplot as plt
-else:
-	import matplotlib.pyplot as plt
-	import matplotlib.lines as mlines
-
 from Evaluation import GraphDataOrganizer as gdo
 from Evaluation import ExperimentManager as em
 from Evaluation import StatisticsManager as sm
@@ -24,10 +13,8 @@ from MetaScripts import meta
 from MetaScripts import global_settings as gs
 
 def init_texoutputstring():
-	texoutputstring = ""
 	with open("tex_template.txt", "r") as tex_template:
-		for line in tex_template:
-			texoutputstring += line
+		texoutputstring = tex_template.read()
 	return texoutputstring
 
 def construct_output_table_alldata(graphclass, columns, dataset, outputfilenamesuffix=""):
@@ -38,18 +25,10 @@ def construct_output_table_alldata(graphclass, columns, dataset, outputfilenames
 	# sort dataset:
 	sorteddataset = sorted(dataset, key=lambda data: (data["avg n"], data["graph id"], data["algorithm"], data["repeats"], data["reduced"]))
 
-	texoutputstring = init_texoutputstring()
-	tabulardefline = "\\begin{longtable}{"
-	for i in range(len(columns)):
-		tabulardefline += "c"
-	tabulardefline += "}"
-	texoutputstring += tabulardefline+"\n"
-
-	tabheadline = columns[0]
-	for i in range(1,len(columns)):
-		tabheadline += " & "+columns[i]
-	tabheadline += " \\\\ \\hline \n"
-	texoutputstring += tabheadline
+	# the output is collected in a list of strings and joined once:
+	texoutputparts = [init_texoutputstring()]
+	texoutputparts.append("\\begin{longtable}{"+"c"*len(columns)+"}\n")
+	texoutputparts.append(" & ".join(columns)+" \\\\ \\hline \n")
 	#all_graph_ids = [key for key in dataset if not key == "algo"]
 	data_keys = [key for key in columns] #if not key == "algorithm" and not key == "graph id"]
 
@@ -57,24 +36,29 @@ def construct_output_table_alldata(graphclass, columns, dataset, outputfilenames
 	string_data_keys = ["algorithm", "reduced"]
 	might_be_string_data_keys = ["mean time", "var time", "moo", "voo", "mmo", "mvo"]
 
+	# precompute the format of each column, as (key, is numeric, may be printed as string, formatstring, precision):
+	column_formats = []
+	for data_key in data_keys:
+		if data_key ==  "mean time":
+			formatstring, precision = "${0:.4f}$", 4
+		else:
+			formatstring, precision = "${0:.2f}$", 2
+		column_formats.append((data_key, data_key not in non_numeric_data_keys, data_key in string_data_keys+might_be_string_data_keys, formatstring, precision))
+
 	for data in sorteddataset:
-		rowstring = "\\verb+"+data["graph id"]+ "+"
+		rowparts = ["\\verb+"+data["graph id"]+ "+"]
 		#rowstring = "\\verb+"+data["algo"] + "+ & \\verb+" + data["graph_id"] + "+"
-		for data_key in data_keys:
+		for data_key, is_numeric, may_be_string, formatstring, precision in column_formats:
 			#print(data_key +": "+str(data[data_key]))
-			if data_key not in non_numeric_data_keys and not isinstance(data[data_key], str):
-				if data_key ==  "mean time":
-					precision = 4
-					formatstring = "${0:.4f}$"
-				else:
-					precision = 2
-					formatstring = "${0:.2f}$"
-				rowstring += " & "+formatstring.format(round(data[data_key],precision))
-			elif data_key in string_data_keys+might_be_string_data_keys:
-				rowstring += " & \\verb+"+data[data_key]+"+"
-		texoutputstring += rowstring+"\\\\\n"
-	texoutputstring += "\\end{longtable}\n"
-	texoutputstring += "\\end{document}\n"
+			value = data[data_key]
+			if is_numeric and not isinstance(value, str):
+				rowparts.append(" & "+formatstring.format(round(value,precision)))
+			elif may_be_string:
+				rowparts.append(" & \\verb+"+value+"+")
+		rowparts.append("\\\\\n")
+		texoutputparts.append("".join(rowparts))
+	texoutputparts.append("\\end{longtable}\n")
+	texoutputparts.append("\\end{document}\n")
 	
 	if not outputfilenamesuffix == "":
 		outputfilename = "table_total_"+outputfilenamesuffix+".tex"
@@ -86,7 +70,7 @@ def construct_output_table_alldata(graphclass, columns, dataset, outputfilenames
 		os.mkdir(tablesdir)
 		
 	with open(tablesdir+"/"+outputfilename, "w") as tex_output:
-		tex_output.write(texoutputstring)
+		tex_output.write("".join(texoutputparts))
 		
 def construct_table_compare_randomized(graphclass, density_class, outputfilenamesuffix="", axis="OUTPUT"):
 	'''
@@ -253,7 +237,7 @@ def construct_table_compare(graphclass, density_class, algocodes=None, randcodes
 		reduced = True
 		
 	if "CMP" in colormode:
-		color_cmp_key = re.split('_', colormode)[1]
+		color_cmp_key = colormode.split('_')[1]
 		if not color_cmp_key in gs.BASE_ALGO_CODES:
 			colormode = "NONE"
 		else:
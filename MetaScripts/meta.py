@@ -14,3 +14,22 @@ def print_progress(part, total, front_string="Progress:", end_string=""):
 class My_JSON_Encoder(json.JSONEncoder):
 	def default(self, obj):
 		return obj.__json__()
+
+_pyplot = None
+
+def get_pyplot():
+	'''
+	imports matplotlib.pyplot on the first call and returns it.
+	matplotlib is only loaded if something gets plotted, such that scripts that only compute statistics
+	do not pay for its import. If tkinter is not available, the non-interactive backend 'agg' is used.
+	'''
+	global _pyplot
+	if _pyplot == None:
+		try:
+			import tkinter
+		except ImportError:
+			import matplotlib
+			matplotlib.use('agg')
+		import matplotlib.pyplot as plt
+		_pyplot = plt
+	return _pyplot
@@ -4,10 +4,10 @@
 import logging
 
 import networkx as nx
+import itertools
 import random
 import numpy as np
 import time
-import copy
 
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
 
@@ -106,12 +106,13 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 		'''
 		logging.info("=== CMT.minimize_triangulation ===")
 		
-		F_prime = copy.deepcopy(F)
+		# F_prime is kept as an ordered dict (with values None), such that membership tests and removals take constant time:
+		F_prime = dict.fromkeys(F)
 		H = G.copy()
 		H.add_edges_from(F_prime)
 
 		# initialize set V_F of all nodes that are endpoint of some edge in F:
-		V_F = list(set([v for e in F_prime for v in e]))
+		V_F = set([v for e in F_prime for v in e])
 		
 		# initialize T: all edges e with len(T[e]) == 0 are removeable
 		if T == None:
@@ -143,11 +144,11 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 				if (v,x) in F_prime:
 					for e in [e for e in T[(v,x)] if u in e]:
 						T[(v,x)].discard(e)
-			F_prime.remove(edge_uv)
+			del F_prime[edge_uv]
 			H.remove_edges_from([edge_uv])
 			edge_uv = self.get_removeable_edge(F_prime, T, randomized)
 
-		return F_prime
+		return list(F_prime)
 		
 	def get_edges_of_inverse_graph(self, G):
 		'''
@@ -160,15 +161,7 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 			F : a set of edges s.t. no edge from F is in G and G + F is a complete graph
 		'''
 
-		F = []
-		E = [e for e in G.edges()]
-		V = list(G.nodes())
-		for i in range(len(G.nodes())):
-			for j in range(i+1, len(G.nodes())):
-				e = (V[i],V[j])
-				if e not in E:
-					F.append(e)
-		return F
+		return [e for e in itertools.combinations(G.nodes(), 2) if not G.has_edge(*e)]
 
 	def get_removeable_edge(self, F, T, randomized):
 		'''
@@ -7,12 +7,15 @@ import networkx as nx
 import random
 import numpy as np
 import time
+import heapq
 
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
 from TriangulationAlgorithms import CMT
 
-def triangulate_EG(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
-	algo = Algorithm_EliminationGame(G, reduce_graph, timeout)
+logger = logging.getLogger(__name__)
+
+def triangulate_EG(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, heuristic=None):
+	algo = Algorithm_EliminationGame(G, reduce_graph, timeout, heuristic)
 	if not randomized:
 		algo.run()
 		return {
@@ -25,13 +28,14 @@ def triangulate_EG(G, randomized=False, repetitions=1, reduce_graph=True, timeou
 	else:
 		H_opt = None
 		size_opt = None
-		all_sizes = []
+		all_sizes = np.empty(repetitions, dtype=np.int32)
 		for i in range(repetitions):
 			algo.run_randomized()
-			all_sizes.append(len(algo.get_triangulation_edges()))
-			if H_opt == None or len(algo.get_triangulation_edges()) < size_opt:
+			size = len(algo.get_triangulation_edges())
+			all_sizes[i] = size
+			if H_opt == None or size < size_opt:
 				H_opt = algo.get_triangulated()
-				size_opt = len(algo.get_triangulation_edges())
+				size_opt = size
 		return {
 			"H" : H_opt,
 			"size" : size_opt,
@@ -40,11 +44,11 @@ def triangulate_EG(G, randomized=False, repetitions=1, reduce_graph=True, timeou
 			"repetitions" : repetitions
 			}
 	
-def triangulate_EGPLUS(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
+def triangulate_EGPLUS(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, heuristic=None):
 	'''
 	run Elimination Game, but minimize the result using CMT
 	'''
-	algo = Algorithm_EliminationGame(G, reduce_graph, timeout)
+	algo = Algorithm_EliminationGame(G, reduce_graph, timeout, heuristic)
 	minimizer = CMT.Algorithm_CMT(G, False, timeout)
 	if not randomized:
 		algo.run()
@@ -78,9 +82,10 @@ def triangulate_EGPLUS(G, randomized=False, repetitions=1, reduce_graph=True, ti
 			"repetitions" : 1
 			}
 	else:
-		H_opt = None
+		F_opt = None
 		size_opt = None
-		all_sizes = []
+		all_sizes = np.empty(repetitions*repetitions, dtype=np.int32)
+		number_of_runs = 0
 		for i in range(repetitions):
 			algo.run_randomized()
 			F = algo.get_triangulation_edges()
@@ -100,13 +105,18 @@ def triangulate_EGPLUS(G, randomized=False, repetitions=1, reduce_graph=True, ti
 			
 			for j in range(repetitions):
 				F_prime = minimizer.minimize_triangulation(G, algo.get_triangulation_edges(), True, T)
-				H_prime = G.copy()
-				H_prime.add_edges_from(F_prime)
 				
-				all_sizes.append(len(F_prime))
-				if H_opt == None or len(F_prime) < size_opt:
-					H_opt = H_prime
+				all_sizes[number_of_runs] = len(F_prime)
+				number_of_runs += 1
+				if F_opt == None or len(F_prime) < size_opt:
+					F_opt = F_prime
 					size_opt = len(F_prime)
+		
+		# construct the triangulated graph only for the best result:
+		H_opt = None
+		if not F_opt == None:
+			H_opt = G.copy()
+			H_opt.add_edges_from(F_opt)
 		return {
 			"H" : H_opt,
 			"size" : size_opt,
@@ -116,9 +126,23 @@ def triangulate_EGPLUS(G, randomized=False, repetitions=1, reduce_graph=True, ti
 			}
 	
 class Algorithm_EliminationGame(ta.TriangulationAlgorithm):
-	def __init__(self, G, reduce_graph=True, timeout=-1):
-		logging.info("=== EG.Algorithm_EliminationGame.init ===")
+	'''
+	Args:
+		G : a graph in netwokx format
+		heuristic : if None, the nodes are eliminated in the order alpha (or in random order).
+			Otherwise, the next node to eliminate is chosen greedily by the heuristic:
+			"min_degree" chooses a node with the minimum number of neighbors,
+			"min_deficiency" chooses a node with the minimum number of fill edges (i.e. missing edges between its neighbors).
+			Ties are broken by the order of the nodes, or randomly if randomized.
+	'''
+	def __init__(self, G, reduce_graph=True, timeout=-1, heuristic=None):
+		logger.info("=== EG.Algorithm_EliminationGame.init ===")
+		if heuristic not in [None, "min_degree", "min_deficiency"]:
+			raise ValueError("Unknown elimination heuristic: "+str(heuristic))
 		super().__init__(G, reduce_graph, timeout)
+		self.heuristic = heuristic
+		# the matrices of the jit-compiled elimination, reused over the repetitions of a randomized run:
+		self.elimination_buffers = None
 	
 	def triangulate(self, G, randomized=False, alpha=None):
 		'''
@@ -126,43 +150,123 @@ class Algorithm_EliminationGame(ta.TriangulationAlgorithm):
 		
 		Args:
 			G : the input graph in networkx format
-			alpha : an ordering of the nodes that defines the order in which the nodes are processed, as a dict {node: position}
-			randomized : if no ordering alpha is specified and randomized is set to True, the order of the nodes is shuffled
+			alpha : an ordering of the nodes that defines the order in which the nodes are processed, as a dict {node: position}.
+				has no effect if a heuristic is set.
+			randomized : if no ordering alpha is specified and randomized is set to True, the order of the nodes is shuffled.
+				if a heuristic is set, ties are broken randomly.
 	
 		Returns:
 			F : a set of edges such that G + F is a minimum triangulation of G
 		'''
-		logging.info("=== elimination_game_triangulation ===")
-		logging.debug("Alpha: "+str(alpha))
+		logger.info("=== elimination_game_triangulation ===")
+		logger.debug("Alpha: %s", alpha)
+		
+		if self.heuristic == None:
+			if alpha == None:
+				all_nodes = [n for n in G]
+				if randomized:
+					random.shuffle(all_nodes)
+				self.alpha = {}
+				i = 0
+				for n in all_nodes:
+					self.alpha[n] = i
+					i += 1
+			else:
+				all_nodes = sorted([n for n in alpha.keys()], key=lambda x: alpha[x])
+				self.alpha = alpha
+			
+			# use the jit-compiled elimination if numba is installed.
+			# it checks the timeout every ek.ELIMINATION_SLICE_SIZE nodes:
+			from TriangulationAlgorithms import EliminationKernels as ek
+			if ek.NUMBA_AVAILABLE and len(G) <= ek.MAX_NUMBER_OF_NODES:
+				if self.elimination_buffers == None:
+					self.elimination_buffers = ek.EliminationBuffers()
+				return ek.eliminate_nodes(G, all_nodes, self.elimination_buffers, self.timeout)
 		
-		if alpha == None:
-			all_nodes = [n for n in G]
-			if randomized:
-				random.shuffle(all_nodes)
+		# the elimination is played on a plain adjacency structure instead of a networkx graph.
+		# the neighbors are kept in (ordered) dicts, such that they are visited in the same order as in a networkx graph:
+		adjacency = {n : dict.fromkeys(G.neighbors(n)) for n in G}
+		
+		if not self.heuristic == None:
+			# alpha is constructed during the elimination:
+			all_nodes = self.get_heuristic_elimination_order(adjacency, randomized)
 			self.alpha = {}
-			i = 0
-			for n in all_nodes:
-				self.alpha[n] = i
-				i += 1
-		else:
-			all_nodes = sorted([n for n in alpha.keys()], key=lambda x: alpha[x])
-			self.alpha = alpha
-		G_temp = G.copy()
+		# the check is done once, since the loop below logs for every added edge and removed node:
+		debug_enabled = logger.isEnabledFor(logging.DEBUG)
 		F = []
-		for node in all_nodes:
-			# check timeout:
-			if self.timeout > 0 and time.time() > self.timeout:
+		for number_of_eliminated_nodes, node in enumerate(all_nodes):
+			# check timeout every 1024 nodes (the deadline is a time.time() timestamp):
+			if self.timeout > 0 and number_of_eliminated_nodes & 0x3FF == 0 and time.time() > self.timeout:
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 
-			all_neighbors = [n for n in G_temp.neighbors(node)]
+			all_neighbors = list(adjacency[node])
 			for i in range(0, len(all_neighbors)):
+				neighbors_i = adjacency[all_neighbors[i]]
 				for j in range(i+1, len(all_neighbors)):
-					edge_between_neighbors = (all_neighbors[i], all_neighbors[j])
-					if edge_between_neighbors not in G_temp.edges():
-						G_temp.add_edges_from([edge_between_neighbors])
+					if all_neighbors[j] not in neighbors_i:
+						edge_between_neighbors = (all_neighbors[i], all_neighbors[j])
+						neighbors_i[all_neighbors[j]] = None
+						adjacency[all_neighbors[j]][all_neighbors[i]] = None
 						F.append(edge_between_neighbors)
-						logging.debug("Added edge: "+str(edge_between_neighbors))
-			G_temp.remove_node(node)
-			logging.debug("removed node: "+str(node))
+						if debug_enabled:
+							logger.debug("Added edge: %s", edge_between_neighbors)
+			for neighbor in all_neighbors:
+				del adjacency[neighbor][node]
+			del adjacency[node]
+			if debug_enabled:
+				logger.debug("removed node: %s", node)
+			if not self.heuristic == None:
+				self.alpha[node] = len(self.alpha)
 			
-		return F
\ No newline at end of file
+		return F
+
+	def get_elimination_key(self, adjacency, node):
+		'''
+		computes the value of a node by which the heuristic chooses the next node to eliminate
+		(the lower, the better), i.e. the degree or the deficiency of the node
+		'''
+		neighbors = list(adjacency[node])
+		if self.heuristic == "min_degree":
+			return len(neighbors)
+		deficiency = 0
+		for i in range(len(neighbors)):
+			neighbors_i = adjacency[neighbors[i]]
+			for j in range(i+1, len(neighbors)):
+				if neighbors[j] not in neighbors_i:
+					deficiency += 1
+		return deficiency
+
+	def get_heuristic_elimination_order(self, adjacency, randomized):
+		'''
+		Yields the nodes in the order in which they get eliminated by the heuristic.
+		The nodes are kept in a heap by their key. Entries of a node get outdated when the node's key changes,
+		so they are skipped when they get popped.
+		The caller has to eliminate each yielded node from adjacency before the next node is requested,
+		such that the keys of the affected nodes can be updated.
+
+		Args:
+			adjacency : a dict {node : neighbors}, that gets modified by the caller
+			randomized : if True, ties are broken randomly. Otherwise, by the order of the nodes in adjacency.
+		'''
+		if randomized:
+			tiebreak = {n : random.random() for n in adjacency}
+		else:
+			tiebreak = {n : i for i, n in enumerate(adjacency)}
+		key = {n : self.get_elimination_key(adjacency, n) for n in adjacency}
+		heap = [(key[n], tiebreak[n], n) for n in adjacency]
+		heapq.heapify(heap)
+		while len(heap) > 0:
+			node_key, node_tiebreak, node = heapq.heappop(heap)
+			if node not in adjacency or not key[node] == node_key:
+				continue
+			neighbors = list(adjacency[node])
+			yield node
+			# the elimination changes the degree of the neighbors,
+			# and the deficiency of the neighbors and of their neighbors:
+			affected_nodes = set(neighbors)
+			if self.heuristic == "min_deficiency":
+				for neighbor in neighbors:
+					affected_nodes.update(adjacency[neighbor])
+			for n in affected_nodes:
+				key[n] = self.get_elimination_key(adjacency, n)
+				heapq.heappush(heap, (key[n], tiebreak[n], n))
\ No newline at end of file
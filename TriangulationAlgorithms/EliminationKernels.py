@@ -0,0 +1,147 @@
+#!usr/bin/python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import time
+
+from TriangulationAlgorithms import TriangulationAlgorithm as ta
+
+try:
+	import numba
+except ImportError:
+	numba = None
+
+NUMBA_AVAILABLE = not numba == None
+
+# the kernel works on dense adjacency matrices (5 MB for 1000 nodes), so it is only used for graphs up to this number of nodes:
+MAX_NUMBER_OF_NODES = 1000
+# the timeout can not be checked inside the kernel, so the nodes are eliminated in slices of this size
+# and the timeout is checked before each slice:
+ELIMINATION_SLICE_SIZE = 64
+
+if NUMBA_AVAILABLE:
+	@numba.njit(cache=True)
+	def eliminate_ordered(adjacency, stamps, order, next_stamp):
+		'''
+		jit-compiled version of the elimination game (see EG.Algorithm_EliminationGame.triangulate).
+		The neighbors of a node are visited in the order in which they became adjacent (given by stamps),
+		which is the order in which networkx (and the python implementation) visits them.
+		Therefore the fill edges are the same, in the same order, as in the python implementation.
+
+		Args:
+			adjacency : a 2D boolean numpy array, the adjacency matrix of the graph. Gets modified.
+			stamps : a 2D numpy array of type int32, stamps[u,v] is the time at which v became a neighbor of u. Gets modified.
+			order : a numpy array that contains the indices of the nodes in the order in which they get eliminated.
+				this can be a part of the elimination order, the elimination is continued by the next call with the same matrices.
+			next_stamp : the next unused stamp
+
+		Return:
+			(fill_u, fill_v, next_stamp) : two numpy arrays that contain the endpoints of the fill edges, and the next unused stamp
+		'''
+		number_of_nodes = adjacency.shape[0]
+		# the arrays of fill edges grow by doubling:
+		fill_u = np.empty(max(16, number_of_nodes), dtype=np.int32)
+		fill_v = np.empty(max(16, number_of_nodes), dtype=np.int32)
+		number_of_fill_edges = 0
+		neighbors = np.empty(number_of_nodes, dtype=np.int32)
+		neighbor_stamps = np.empty(number_of_nodes, dtype=np.int32)
+		for node in order:
+			# collect the neighbors of node, ordered by the time they became adjacent:
+			degree = 0
+			for u in range(number_of_nodes):
+				if adjacency[node, u]:
+					neighbors[degree] = u
+					neighbor_stamps[degree] = stamps[node, u]
+					degree += 1
+			ordered_neighbors = neighbors[:degree][np.argsort(neighbor_stamps[:degree])]
+			# make sure that the fill edges of this node fit into the arrays:
+			required_length = number_of_fill_edges+degree*(degree-1)//2
+			if required_length > len(fill_u):
+				new_length = max(required_length, 2*len(fill_u))
+				fill_u = np.concatenate((fill_u, np.empty(new_length-len(fill_u), dtype=np.int32)))
+				fill_v = np.concatenate((fill_v, np.empty(new_length-len(fill_v), dtype=np.int32)))
+			# make the neighborhood a clique:
+			for i in range(degree):
+				a = ordered_neighbors[i]
+				for j in range(i+1, degree):
+					b = ordered_neighbors[j]
+					if not adjacency[a, b]:
+						adjacency[a, b] = True
+						stamps[a, b] = next_stamp
+						adjacency[b, a] = True
+						stamps[b, a] = next_stamp+1
+						next_stamp += 2
+						fill_u[number_of_fill_edges] = a
+						fill_v[number_of_fill_edges] = b
+						number_of_fill_edges += 1
+			# remove node:
+			for i in range(degree):
+				adjacency[node, ordered_neighbors[i]] = False
+				adjacency[ordered_neighbors[i], node] = False
+		return (fill_u[:number_of_fill_edges], fill_v[:number_of_fill_edges], next_stamp)
+
+	# compile once on import, so that the first call is not slowed down by the jit compilation:
+	eliminate_ordered(np.zeros((2, 2), dtype=np.bool_), np.zeros((2, 2), dtype=np.int32), np.arange(2, dtype=np.int32), 0)
+else:
+	eliminate_ordered = None
+
+class EliminationBuffers:
+	'''
+	The matrices used by the kernel. They get allocated for the largest graph seen so far
+	and are reused for the following calls, e.g. for all components and repetitions of a randomized run.
+	'''
+	def __init__(self):
+		self.adjacency = np.zeros(0, dtype=np.bool_)
+		self.stamps = np.zeros(0, dtype=np.int32)
+
+	def get_matrices(self, number_of_nodes):
+		'''
+		Args:
+			number_of_nodes : the number of nodes of the graph
+
+		Return:
+			(adjacency, stamps) : a boolean matrix of zeros and an uninitialized int32 matrix, both of shape (number_of_nodes, number_of_nodes)
+		'''
+		size = number_of_nodes*number_of_nodes
+		if len(self.adjacency) < size:
+			self.adjacency = np.zeros(size, dtype=np.bool_)
+			self.stamps = np.zeros(size, dtype=np.int32)
+		adjacency = self.adjacency[:size].reshape((number_of_nodes, number_of_nodes))
+		adjacency[:] = False
+		return (adjacency, self.stamps[:size].reshape((number_of_nodes, number_of_nodes)))
+
+def eliminate_nodes(G, all_nodes, buffers=None, timeout=-1):
+	'''
+	Runs the elimination game on G with the jit-compiled kernel.
+	Requires numba, see NUMBA_AVAILABLE.
+	The nodes are eliminated in slices of ELIMINATION_SLICE_SIZE nodes, the timeout is checked before each slice.
+
+	Args:
+		G : a graph in networkx format
+		all_nodes : the nodes of G in the order in which they get eliminated
+		buffers : an EliminationBuffers object whose matrices get reused. If None, new matrices get allocated.
+		timeout : if > 0, a TimeLimitExceededException is raised if time.time() exceeds this value
+
+	Return:
+		F : a list of edges such that G + F is a triangulation of G
+	'''
+	if buffers == None:
+		buffers = EliminationBuffers()
+	nodes = [n for n in G]
+	index = {nodes[i] : i for i in range(len(nodes))}
+	adjacency, stamps = buffers.get_matrices(len(nodes))
+	next_stamp = 0
+	for u in nodes:
+		for v in G.neighbors(u):
+			adjacency[index[u], index[v]] = True
+			stamps[index[u], index[v]] = next_stamp
+			next_stamp += 1
+	order = np.array([index[n] for n in all_nodes], dtype=np.int32)
+	F = []
+	for start in range(0, len(order), ELIMINATION_SLICE_SIZE):
+		# check timeout:
+		if timeout > 0 and time.time() > timeout:
+			raise ta.TimeLimitExceededException("Time Limit Exceeded!")
+		fill_u, fill_v, next_stamp = eliminate_ordered(adjacency, stamps, order[start:start+ELIMINATION_SLICE_SIZE], next_stamp)
+		F += [(nodes[u], nodes[v]) for u, v in zip(fill_u.tolist(), fill_v.tolist())]
+	return F
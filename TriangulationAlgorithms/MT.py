@@ -10,6 +10,8 @@ import time
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
 from TriangulationAlgorithms import LEX_M
 
+logger = logging.getLogger(__name__)
+
 def triangulate_MT(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
 	algo = Algorithm_MinimumTriangulation(G, reduce_graph, timeout)
 	algo.run()
@@ -23,7 +25,7 @@ def triangulate_MT(G, randomized=False, repetitions=1, reduce_graph=True, timeou
 
 class Algorithm_MinimumTriangulation(ta.TriangulationAlgorithm):
 	def __init__(self, G, reduce_graph=True, timeout=-1):
-		logging.info("=== MT.Algorithm_MinimumTriangulation.init ===")
+		logger.info("=== MT.Algorithm_MinimumTriangulation.init ===")
 		super().__init__(G, reduce_graph, timeout)
 		
 	def triangulate(self, C, randomized=False):
@@ -37,31 +39,44 @@ class Algorithm_MinimumTriangulation(ta.TriangulationAlgorithm):
 		Return:
 			F : a set of edges such that C + F is a minimum triangulation
 		'''
-		logging.info("=== MT.triangulate ===")
+		logger.info("=== MT.triangulate ===")
 
 		if nx.is_chordal(C):
-			logging.debug("Component is already chordal")
+			logger.debug("Component is already chordal")
 			return []
 	
 		# use LEX-M to determine the size of a minimal triangulation to have an upper bound for the minimum triangulation
 		lexm_triang = LEX_M.triangulate_LexM(C)
 		size_minimal = lexm_triang["size"]
-		logging.debug("size of minimal: "+str(size_minimal))
+		logger.debug("size of minimal: %s", size_minimal)
+		
+		# only the chord edges within C can help to make C chordal:
+		if self.chordedge_candidates == None:
+			chordedge_candidates = [e for e in itertools.combinations(C.nodes(), 2) if not C.has_edge(*e)]
+		else:
+			chordedge_candidates = [e for e in self.chordedge_candidates if C.has_node(e[0]) and C.has_node(e[1])]
+		logger.debug("number of chord edge candidates: %s", len(chordedge_candidates))
+		
+		# no set of chord edges smaller than the lower bound can make C chordal:
+		lower_bound = self.get_lower_bound(C)
+		logger.debug("lower bound: %s", lower_bound)
 		
 		F = []
-		# iterate through all subsets of chord edges by increasing set size.
+		# iterate through all subsets of chord edges by increasing set size, starting at the lower bound.
 		# for each subset, check if self.G + additional edges is chordal
 		# return first set of edges that makes self.G chordal. this is a minimum triangulation.
-		k = 1
+		# if the lower bound reaches the size of the minimal triangulation, the minimal triangulation is a minimum triangulation.
+		k = max(1, lower_bound)
 		found_minimum = False
-		#print (self.chordedge_candidates)
+		# a single working graph is used for all subsets: the edges of a subset are added for the check and removed afterwards
+		H = C.copy()
 		while not found_minimum and k < size_minimal:
 			# check timeout:
 			if self.timeout > 0 and time.time() > self.timeout:
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 
-			logging.debug("Current iteration: consider edgesets of size "+str(k))
-			edgesets_size_k = itertools.combinations(self.chordedge_candidates, k)
+			logger.debug("Current iteration: consider edgesets of size %s", k)
+			edgesets_size_k = itertools.combinations(chordedge_candidates, k)
 			k_edgeset = 0
 			for edgeset in edgesets_size_k:
 				#print (edgeset)
@@ -70,15 +85,46 @@ class Algorithm_MinimumTriangulation(ta.TriangulationAlgorithm):
 					# check timeout every 10k sets:
 					if self.timeout > 0 and time.time() > self.timeout:
 						raise ta.TimeLimitExceededException("Time Limit Exceeded!")
-				H = C.copy()
 				H.add_edges_from(edgeset)
-				if nx.is_chordal(H):
+				is_chordal = nx.is_chordal(H)
+				H.remove_edges_from(edgeset)
+				if is_chordal:
 					F += [e for e in edgeset]
 					found_minimum = True
 					break
 			k += 1
 		if not found_minimum:
-			F += [e for e in lexm_triang["H"].edges() if e not in C.edges()]
+			F += [e for e in lexm_triang["H"].edges() if not C.has_edge(*e)]
 			
 		return F
-		
\ No newline at end of file
+		
+
+	def get_lower_bound(self, C):
+		'''
+		Computes a lower bound for the size of a minimum triangulation of a graph.
+		A chordless cycle of length l needs at least l-3 chord edges between its nodes to become chordal,
+		so the sum of l-3 over vertex-disjoint chordless cycles is a lower bound.
+		The cycles are found greedily: for an edge (u,v), a shortest path from u to v without this edge
+		closes a chordless cycle. The nodes of each cycle of length >= 4 are removed before the next edge is considered.
+		
+		Args:
+			C : a graph in networkx format
+			
+		Return:
+			lower_bound : an integer
+		'''
+		lower_bound = 0
+		R = nx.Graph(C)
+		for (u, v) in list(C.edges()):
+			if not R.has_edge(u, v):
+				continue
+			R.remove_edge(u, v)
+			try:
+				path = nx.shortest_path(R, u, v)
+			except nx.NetworkXNoPath:
+				path = []
+			R.add_edge(u, v)
+			if len(path) >= 4:
+				lower_bound += len(path)-3
+				R.remove_nodes_from(path)
+		return lower_bound
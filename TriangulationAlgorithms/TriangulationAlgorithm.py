@@ -4,14 +4,9 @@
 import logging
 
 import networkx as nx
-try:
-	import tkinter
-except ImportError:
-	import matplotlib
-	matplotlib.use('agg')
-	import matplotlib.pyplot as plt
-else:
-	import matplotlib.pyplot as plt
+import itertools
+
+from MetaScripts import meta
 
 class TriangulationNotSuccessfulException(Exception):
 	'''
@@ -42,6 +37,8 @@ class TriangulationAlgorithm:
 		component_subgraphs : a list of graphs in networkx format
 			if G was reduced, this contains each component of the reduced G as a graph.
 			otherwise, it contains only G
+		chordedge_candidates : a list of the edges that are not in G but join two nodes of the same component
+			of the reduced G. None if G was not reduced
 		H : the triangulated graph
 		edges_of_triangulation : the set of edges that are added to G to achieve H
 		alpha : a dict {node: int} that contains a perfect elimination ordering, if one gets constructed
@@ -49,6 +46,8 @@ class TriangulationAlgorithm:
 	def __init__(self, G, reduce_graph=True, timeout=-1):
 		self.G = G
 		self.component_subgraphs = [G]
+		self.G_c = None
+		self.chordedge_candidates = None
 		if reduce_graph:
 			self.get_relevant_components()
 			self.get_chordedge_candidates()
@@ -59,6 +58,7 @@ class TriangulationAlgorithm:
 		self.timeout = timeout
 
 	def run(self):
+		self.edges_of_triangulation = []
 		self.alpha = {}
 		for C in self.component_subgraphs:
 			# get triangulation for each connected component of the reduced graph G_c:
@@ -68,7 +68,7 @@ class TriangulationAlgorithm:
 		self.H.add_edges_from(self.edges_of_triangulation)
 		
 		if not nx.is_chordal(self.H):
-			raise ta.TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
+			raise TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
 			
 	def run_randomized(self):
 		self.edges_of_triangulation = []
@@ -81,7 +81,7 @@ class TriangulationAlgorithm:
 		self.H.add_edges_from(self.edges_of_triangulation)
 		
 		if not nx.is_chordal(self.H):
-			raise ta.TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
+			raise TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
 	
 	def get_triangulated(self):
 		return self.H
@@ -112,16 +112,12 @@ class TriangulationAlgorithm:
 
 		self.chordedge_candidates = []
 		for c in nx.connected_components(self.G_c):
-			c = list(c)
-			for i in range(len(c)):
-				for j in range(i+1, len(c)):
-					chord_edge = (c[i], c[j])
-					if chord_edge not in self.G.edges():
-						self.chordedge_candidates.append(chord_edge)
+			self.chordedge_candidates += [e for e in itertools.combinations(c, 2) if not self.G.has_edge(*e)]
 		
 		logging.debug ("chordedge candidates: "+str(self.chordedge_candidates))
 
 	def draw_triangulation(self):
+		plt = meta.get_pyplot()
 		edges_original = self.G.edges()
 
 		#pos = nx.shell_layout(self.G)
@@ -17,6 +17,8 @@ class Cycle:
 		self.cyclenodes = []
 		for i in range(0, len(cyclenodes), cycle_dir):
 			self.cyclenodes.append(cyclenodes[(i+min_index)%cyclelength])
+		# the rotated node sequence identifies the cycle, it is used for hashing and comparison:
+		self.key = tuple(self.cyclenodes)
 
 	def __str__(self):
 		return str(self.cyclenodes)	
@@ -31,11 +33,10 @@ class Cycle:
 		return key in self.cyclenodes
 
 	def __hash__(self):
-		return hash(str(self.cyclenodes))
+		return hash(self.key)
 		
 	def __eq__(self, other):
-		# we can simply use the hash-values to compare cycles
-		return hash(str(self.cyclenodes)) == hash(str(other.cyclenodes))
+		return self.key == other.key
 
 def get_post_order(T, root=None):
 	'''
@@ -194,6 +195,8 @@ def get_all_cycles_single_startnode(G, startnode, min_cycle_length=4, only_chord
 	logging.debug("Graph "+str(G.edges()))
 
 	cycles = []
+	# the cycles found so far are also kept in a set, for a fast check if a cycle is new:
+	found_cycles = set()
 	visited = {n : 0 for n in G}
 	visited[startnode] = 1
 	predecessors = {}
@@ -225,9 +228,10 @@ def get_all_cycles_single_startnode(G, startnode, min_cycle_length=4, only_chord
 				if add_this_cycle:
 					new_cycle = Cycle(cycle)
 					logging.debug("Cycle: "+str(new_cycle))
-					if new_cycle not in cycles:
+					if new_cycle not in found_cycles:
 						logging.debug("Cycle is new!")
 						cycles.append(new_cycle)
+						found_cycles.add(new_cycle)
 						number_of_added_cycles += 1
 					else:
 						logging.debug("Cycle already exists!")
@@ -5,7 +5,6 @@ import logging
 #import cProfile 
 import os
 import sys
-import re
 import time
 from multiprocessing import Process
 from subprocess import call
@@ -62,9 +61,8 @@ VALID_MODES = ["build", "eval", "output", "test", "evalall", "buildall"]
 
 def fix_filenames(datadir):
 	import os
-	import re
 	for filename in [filename for filename in os.listdir(datadir)]:
-		filenameparts = re.split(r'\.', filename)
+		filenameparts = filename.split('.')
 		new_filename = ''.join(filenameparts[:-1])
 		new_filename += '.'+filenameparts[-1]
 		print ("orig filename: "+filename)
@@ -190,7 +188,7 @@ if __name__ == "__main__":
 	forcenew = False
 	
 	for arg in sys.argv[1:]:			
-		arg_data = re.split(r'=', arg)
+		arg_data = arg.split('=')
 		if arg_data[0] == "mode":
 			if arg_data[1] in VALID_MODES:
 				mode = arg_data[1]
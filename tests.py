@@ -19,6 +19,7 @@ from TriangulationAlgorithms import LEX_M
 from TriangulationAlgorithms import MCS_M
 from TriangulationAlgorithms import CMT
 from TriangulationAlgorithms import MT
+from TriangulationAlgorithms import graph_meta
 
 log_format = ('[%(asctime)s] %(levelname)-8s %(name)-12s %(message)s')
 logging.basicConfig(
@@ -166,6 +167,14 @@ if DO_TEST_ALGO:
 	triangulation_eg_r = EG.triangulate_EG(GRAPH_TEST.copy(), randomized=True)
 	logging.debug("Size of triangulation by randomized elimination game: "+str(triangulation_eg_r["size"]))
 	print("ok")
+
+	logging.info("===== TEST ELIMINATION GAME WITH HEURISTICS =====")
+	print("TEST ELIMINATION GAME WITH HEURISTICS")
+	triangulation_eg_md = EG.triangulate_EG(GRAPH_TEST.copy(), heuristic="min_degree")
+	logging.debug("Size of triangulation by elimination game (min degree): "+str(triangulation_eg_md["size"]))
+	triangulation_eg_mdef = EG.triangulate_EG(GRAPH_TEST.copy(), heuristic="min_deficiency")
+	logging.debug("Size of triangulation by elimination game (min deficiency): "+str(triangulation_eg_mdef["size"]))
+	print("ok")
 	
 	# ===== Elimination Game Plus =====
 	logging.info("===== TEST ELIMINATION GAME PLUS =====")
@@ -243,6 +252,23 @@ if DO_TEST_ALGO:
 	logging.debug("Size of minimum triangulation "+str(triangulation_mt["size"]))
 	print("ok")
 
+	# ===== Cycles (graph_meta) =====
+	logging.info("===== TEST CYCLES =====")
+	print("TEST CYCLES")
+	# rotations of the same cycle are equal and have the same hash:
+	cycle_a = graph_meta.Cycle([2,3,0,1])
+	cycle_b = graph_meta.Cycle([0,1,2,3])
+	cycle_c = graph_meta.Cycle([0,2,1,3])
+	assert cycle_a == cycle_b and hash(cycle_a) == hash(cycle_b)
+	assert not cycle_a == cycle_c
+	assert len(set([cycle_a, cycle_b, cycle_c])) == 2
+	# the cycles found by the DFS contain no duplicates:
+	all_cycles = graph_meta.get_all_cycles(nx.complete_graph(5), 4, False)
+	for i in range(len(all_cycles)):
+		assert all_cycles[i] not in all_cycles[:i]
+	logging.debug("Number of cycles: "+str(len(all_cycles)))
+	print("ok")
+
 	'''
 	# ===== Approximative Minimum Triangulation =====
 	logging.info("===== TEST APPROX MINIMUM TRIANGULATION =====")